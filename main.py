@@ -1,101 +1,341 @@
 import hashlib
 import datetime
-from typing import List
+import multiprocessing
+import os
+import time
+from functools import lru_cache
+from typing import List, Optional
+
+try:
+    import sha256_jit  # Optional Numba-compiled proof-of-work search
+except ImportError:
+    sha256_jit = None
+
+try:
+    import mine_cuda  # Optional CuPy proof-of-work search on the GPU
+except ImportError:
+    mine_cuda = None
+
+def generate_digest(data: bytes) -> bytes:
+    """Generate a raw 32-byte SHA-256 digest for the given bytes."""
+    return hashlib.sha256(data).digest()
 
 def generate_hash(data):
     """Generate a SHA-256 hash for the given data."""
-    return hashlib.sha256(data.encode()).hexdigest()
+    return generate_digest(data.encode()).hex()
+
+def _datetime_from_ns(timestamp_ns: int) -> datetime.datetime:
+    """Convert a time.time_ns() timestamp into an aware UTC datetime for display, exact to the microsecond."""
+    seconds, ns = divmod(timestamp_ns, 10**9)
+    return datetime.datetime.fromtimestamp(seconds, datetime.UTC).replace(microsecond=ns // 1000)
+
+def difficulty_target(difficulty_bits: int) -> bytes:
+    """
+    Return the largest 32-byte digest that satisfies the given difficulty.
+    A digest meets the target when it has at least difficulty_bits leading zero bits, i.e. digest <= target.
+    """
+    if not 0 <= difficulty_bits <= 256:
+        raise ValueError("difficulty_bits must be between 0 and 256")
+    return ((1 << (256 - difficulty_bits)) - 1).to_bytes(32, "big")
+
+def _block_prefix(previous_hash: bytes, ts_bytes: bytes, merkle_root: bytes) -> bytes:
+    """
+    Return the fixed part of a block's hash input, which precedes the nonce.
+    It is zero-padded to a multiple of the 64-byte SHA-256 block size, so the hash state after absorbing it
+    (the midstate) can be reused and each nonce costs exactly one final compression.
+    """
+    data_len = len(previous_hash) + len(ts_bytes) + len(merkle_root)
+    return b"".join((previous_hash, ts_bytes, merkle_root, bytes(-data_len % 64)))
+
+# Length of every block prefix: 32-byte previous hash, 8-byte timestamp and 32-byte Merkle root, aligned to 64 bytes
+_BLOCK_PREFIX_LEN = len(_block_prefix(bytes(32), bytes(8), bytes(32)))
+
+@lru_cache(maxsize=1 << 16)
+def _block_digest(previous_hash: bytes, ts_bytes: bytes, merkle_root: bytes, nonce: int) -> bytes:
+    """Hash the given block contents, memoized so re-validating unchanged blocks skips SHA-256."""
+    h = hashlib.sha256(_block_prefix(previous_hash, ts_bytes, merkle_root))
+    h.update(nonce.to_bytes(8, "little"))
+    return h.digest()
+
+# Smallest batch sizes for which the parallel Numba kernel is used to build Merkle trees and to validate the chain.
+# On a single core hashlib is faster at every size, so the kernel is only used when there are several cores.
+_JIT_MERKLE_MIN_LEAVES = 4096
+_JIT_AUDIT_MIN_BLOCKS = 1024
+_USE_JIT_BATCH = sha256_jit is not None and (os.cpu_count() or 1) > 1
+
+# Number of nonces each hashlib search tries between checks of the stop event
+_SEARCH_CHUNK = 4096
+
+def _find_nonce(prefix: bytes, target: bytes, start: int = 0, stride: int = 1, stop=None) -> Optional[int]:
+    """
+    Find the first nonce in start, start + stride, ... such that SHA-256(prefix + nonce) is no greater than target,
+    with the nonce encoded as 8 little-endian bytes. Returns None if the stop event is set before a nonce is found.
+    """
+    # Absorb the fixed part of the block once; only the nonce changes between attempts
+    base = hashlib.sha256()
+    base.update(prefix)
+
+    # Compare the digest bytes against the target directly, without hex encoding each attempt
+    nonce = start
+    while stop is None or not stop.is_set():
+        for _ in range(_SEARCH_CHUNK):
+            h = base.copy()
+            h.update(nonce.to_bytes(8, "little"))
+            if h.digest() <= target:
+                return nonce
+            nonce += stride  # Step to the next nonce in this search's stride
+    return None
+
+_stop_event = None  # Shared stop event, set in each mining worker process by _init_mining_worker
+
+def _init_mining_worker(stop_event) -> None:
+    """Store the pool's shared stop event in a freshly started worker process."""
+    global _stop_event
+    _stop_event = stop_event
+
+def _mine_stride(prefix: bytes, target: bytes, start: int, stride: int) -> Optional[int]:
+    """Search one stride of the nonce space in a worker, signalling the other workers to stop on success."""
+    if sha256_jit is not None:
+        nonce = sha256_jit.find_nonce(prefix, target, start, stride, _stop_event)
+    else:
+        nonce = _find_nonce(prefix, target, start, stride, _stop_event)
+    if nonce is not None:
+        _stop_event.set()
+    return nonce
+
+# Workers are spawned rather than forked: forking after a parallel Numba kernel has run leaves the parent unable to exit
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+
+class MiningPool:
+    """Searches for nonces in parallel, with each worker process testing a disjoint stride of the nonce space."""
+    def __init__(self, workers: int):
+        self.workers = workers  # Number of worker processes
+        self._stop_event = _MP_CONTEXT.Event()  # Set by the first worker to find a nonce
+        self._pool = _MP_CONTEXT.Pool(workers, initializer=_init_mining_worker, initargs=(self._stop_event,))
+
+    def find_nonce(self, prefix: bytes, target: bytes, start: int = 0) -> int:
+        """Find a nonce such that SHA-256(prefix + nonce) is no greater than target."""
+        self._stop_event.clear()
+        results = [
+            self._pool.apply_async(_mine_stride, (prefix, target, start + i, self.workers))
+            for i in range(self.workers)
+        ]
+
+        # Workers that did not find a nonce return None once the stop event is set
+        found = [nonce for nonce in (result.get() for result in results) if nonce is not None]
+        return min(found)
+
+    def close(self) -> None:
+        """Shut down the worker processes."""
+        self._pool.close()
+        self._pool.join()
 
 class Transaction:
     """Represents a single transaction in the blockchain."""
+    __slots__ = ("sender", "receiver", "amount", "timestamp_ns", "_timestamp", "_cached_str")
     def __init__(self, sender: str, receiver: str, amount: float):
         self.sender = sender # The sender of the transaction
         self.receiver = receiver # The receiver of the transaction
         self.amount = amount # The amount being transferred
-        self.timestamp = datetime.datetime.now(datetime.UTC) # Timestamp of the transaction
+        self.timestamp_ns = time.time_ns() # Timestamp of the transaction, in nanoseconds since the epoch
+        self._timestamp = None  # Datetime form of the timestamp, built on first access
+        self._cached_str = None  # String form of the transaction, built on first use
+
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """The transaction timestamp as a UTC datetime, converted once on first access."""
+        if self._timestamp is None:
+            self._timestamp = _datetime_from_ns(self.timestamp_ns)
+        return self._timestamp
 
     def __str__(self):
         """Returns a human-readable string representation of the transaction."""
-        return f"{self.sender} -> {self.receiver}: {self.amount} BTC @ {self.timestamp}"
+        if self._cached_str is None:
+            self._cached_str = f"{self.sender} -> {self.receiver}: {self.amount} BTC @ {self.timestamp.isoformat()}"
+        return self._cached_str
+
+class IncrementalMerkle:
+    """
+    Builds a Merkle root incrementally as transactions arrive, matching Block.calculate_merkle_root.
+    Only the right spine of completed subtrees is kept, so each addition costs O(log n) hashes.
+    """
+    def __init__(self):
+        self.spine: List[Optional[bytes]] = []  # Root of a complete subtree of 2 ** level leaves, or None, per level
+        self.count = 0  # Number of leaves added
+
+    def add(self, leaf: bytes) -> None:
+        """Add a 32-byte leaf digest, merging completed subtrees like a binary counter carry."""
+        self.count += 1
+        node = leaf
+        for level, spine_node in enumerate(self.spine):
+            if spine_node is None:
+                self.spine[level] = node
+                return
+            node = generate_digest(spine_node + node)
+            self.spine[level] = None
+        self.spine.append(node)
+
+    def add_transaction(self, transaction: Transaction) -> None:
+        """Add a transaction, hashed the same way Block hashes its Merkle leaves."""
+        self.add(generate_digest(str(transaction).encode()))
+
+    def root(self) -> bytes:
+        """Fold the spine into the Merkle root, duplicating the last node of odd levels."""
+        node = None  # Root of the partial subtree covering the rightmost leaves folded so far
+        height = 0
+        for level, spine_node in enumerate(self.spine):
+            if spine_node is None:
+                continue
+            if node is None:
+                node, height = spine_node, level
+                continue
+            while height < level:  # Raise the partial subtree to this level by duplicating it
+                node = generate_digest(node + node)
+                height += 1
+            node = generate_digest(spine_node + node)
+            height = level + 1
+        return node if node is not None else bytes(32)
 
 class Block:
     """Represents a single block in the blockchain."""
-    def __init__(self, transactions: List[Transaction], previous_hash: str):
+    __slots__ = ("transactions", "previous_hash", "timestamp_ns", "_timestamp", "_ts_bytes", "merkle_root", "nonce", "hash", "_canonical_hash")
+    def __init__(self, transactions: List[Transaction], previous_hash: bytes, merkle: Optional[IncrementalMerkle] = None):
         self.transactions = transactions  # List of transactions in the block
         self.previous_hash = previous_hash  # Hash of the previous block
-        self.timestamp = datetime.datetime.now(datetime.UTC)  # Timestamp for when the block is created
-        self.merkle_root = self.calculate_merkle_root()  # Merkle root of the transactions
+        self.timestamp_ns = time.time_ns()  # Timestamp for when the block is created, in nanoseconds since the epoch
+        self._ts_bytes = self.timestamp_ns.to_bytes(8, "little")  # Fixed-width timestamp used for hashing
+        self._timestamp = None  # Datetime form of the timestamp, built on first access
+        if merkle is not None and merkle.count != len(transactions):
+            raise ValueError(f"Merkle tree has {merkle.count} leaves but the block has {len(transactions)} transactions")
+        # Merkle root of the transactions, taken from a tree built as they arrived if one is given
+        self.merkle_root = merkle.root() if merkle is not None else self.calculate_merkle_root()
         self.nonce = 0  # Nonce used for mining (proof-of-work)
         self.hash = self.calculate_hash()  # Hash of the block (calculated based on block contents)
+        self._canonical_hash = None  # Hash recorded when the block was mined, used to detect tampering
     
-    def calculate_merkle_root(self) -> str:
+    @property
+    def timestamp(self) -> datetime.datetime:
+        """The block timestamp as a UTC datetime, converted once on first access."""
+        if self._timestamp is None:
+            self._timestamp = _datetime_from_ns(self.timestamp_ns)
+        return self._timestamp
+
+    def calculate_merkle_root(self) -> bytes:
         """Calculate the Merkle root of the transactions in the block."""
         if not self.transactions:
-            return ""
+            return bytes(32)
+
+        # Hash each transaction into a list of raw 32-byte digests
+        digests = [generate_digest(str(tx).encode()) for tx in self.transactions]
+        if _USE_JIT_BATCH and len(digests) >= _JIT_MERKLE_MIN_LEAVES:
+            return sha256_jit.merkle_root(digests)
 
-        # Hash each transaction into a list of hashes
-        transaction_hashes = [generate_hash(str(tx)) for tx in self.transactions]
+        # Repeatedly combine and hash pairs of digests until one root digest remains
+        while len(digests) > 1:
+            if len(digests) % 2 == 1:  # Duplicate the last digest if there is an odd number
+                digests.append(digests[-1])
 
-        # Repeatedly combine and hash pairs of transaction hashes until one root hash remains
-        while len(transaction_hashes) > 1:
-            if len(transaction_hashes) % 2 == 1:  # Duplicate the last hash if there is an odd number
-                transaction_hashes.append(transaction_hashes[-1])
+            # Pack the level contiguously so each pair is a 64-byte slice
+            level = b"".join(digests)
+            digests = [generate_digest(level[i:i + 64]) for i in range(0, len(level), 64)]
 
-            transaction_hashes = [
-                generate_hash(transaction_hashes[i] + transaction_hashes[i + 1])
-                for i in range(0, len(transaction_hashes), 2)
-            ]
+        return digests[0]
 
-        return transaction_hashes[0]
+    def calculate_hash(self) -> bytes:
+        """Calculate the raw SHA-256 digest of the block using its contents."""
+        return _block_digest(self.previous_hash, self._ts_bytes, self.merkle_root, self.nonce)
 
-    def calculate_hash(self) -> str:
-        """Calculate the hash of the block using its contents."""
-        block_data = f"{self.previous_hash}{self.timestamp}{self.merkle_root}{self.nonce}"
-        return generate_hash(block_data)
+    def hash_preimage(self) -> bytes:
+        """Return the exact bytes hashed by calculate_hash: the aligned block prefix followed by the nonce."""
+        return _block_prefix(self.previous_hash, self._ts_bytes, self.merkle_root) + self.nonce.to_bytes(8, "little")
     
-    def mine_block(self, difficulty: int) -> None:
+    def mine_block(self, target: bytes, pool: Optional["MiningPool"] = None, gpu: bool = False) -> None:
         """
-        Perform proof of work by finding a hash that starts with a specified number of zeros.
-        Difficulty determines the number of leading zeros.
+        Perform proof of work by finding a hash that is no greater than the target.
+        The target comes from difficulty_target, so it encodes the required number of leading zero bits.
+        If gpu is set the nonce search runs on the GPU; otherwise, if a mining pool is given,
+        it is spread across the pool's worker processes.
         """
-        target = 0 * difficulty  # The target pattern for the hash
-        while not self.hash.startswith(str(target)):
-            self.nonce += 1  # Increment the nonce to change the hash
-            self.hash = self.calculate_hash()  # Recalculate the hash with the new nonce
+        prefix = _block_prefix(self.previous_hash, self._ts_bytes, self.merkle_root)
+
+        if gpu:
+            if mine_cuda is None:
+                raise RuntimeError("GPU mining requires CuPy to be installed")
+            self.nonce = mine_cuda.find_nonce(prefix, target, self.nonce)
+        elif pool is not None:
+            self.nonce = pool.find_nonce(prefix, target, self.nonce)
+        elif sha256_jit is not None:
+            self.nonce = sha256_jit.find_nonce(prefix, target, self.nonce)
+        else:
+            self.nonce = _find_nonce(prefix, target, self.nonce)
+
+        # Recompute the winning digest with hashlib so the stored hash never depends on the search backend
+        self.hash = self.calculate_hash()
+        self._canonical_hash = self.hash
     
     def __str__(self):
         """Returns a human-readable string representation of the block."""
         tx_list = "\n".join([str(tx) for tx in self.transactions])
-        return f"Block: Transactions:\n{tx_list}\n  Previous Hash: {self.previous_hash}\n  Hash: {self.hash}\n  Merkle Root: {self.merkle_root}\n  Timestamp: {self.timestamp}\n  Nonce: {self.nonce}"
+        return f"Block: Transactions:\n{tx_list}\n  Previous Hash: {self.previous_hash.hex()}\n  Hash: {self.hash.hex()}\n  Merkle Root: {self.merkle_root.hex()}\n  Timestamp: {self.timestamp}\n  Nonce: {self.nonce}"
 
 class Blockchain:
     """Represents the blockchain as a list of blocks."""
-    def __init__(self, difficulty: int = 2):
+    def __init__(self, difficulty_bits: int = 8, workers: Optional[int] = 1, gpu: bool = False):
         self.chain: List[Block] = []  # List to store all the blocks
-        self.difficulty = difficulty  # Mining difficulty
+        self.difficulty_bits = difficulty_bits  # Mining difficulty as a number of leading zero bits, sets the target
+        workers = workers or os.cpu_count() or 1  # Number of processes used for mining, or None for one per core
+        self.gpu = gpu  # Whether to mine on the GPU
+        self._pool = MiningPool(workers) if workers > 1 and not gpu else None  # Parallel nonce search, if more than one process
         self.create_genesis_block()  # Create the genesis block (first block)
 
+    @property
+    def difficulty_bits(self) -> int:
+        """Mining difficulty as a number of leading zero bits."""
+        return self._difficulty_bits
+
+    @difficulty_bits.setter
+    def difficulty_bits(self, difficulty_bits: int) -> None:
+        """Set the difficulty, recomputing the target and the nonce search specialised for it."""
+        self.target = difficulty_target(difficulty_bits)  # Largest digest accepted by proof-of-work
+        self._difficulty_bits = difficulty_bits
+        if sha256_jit is not None:
+            # Compile now rather than while mining the next block. Pool workers are spawned, so they share nothing
+            # with this process and compile their own copy on first use.
+            sha256_jit.prepare_search(_BLOCK_PREFIX_LEN, self.target)
+
     def create_genesis_block(self) -> None:
         """Create the genesis block and add it to the chain."""
-        genesis_block = Block(transactions=[], previous_hash="0")
-        genesis_block.mine_block(self.difficulty)
+        genesis_block = Block(transactions=[], previous_hash=bytes(32))
+        genesis_block.mine_block(self.target, self._pool, self.gpu)
         self.chain.append(genesis_block)
 
-    def add_block(self, transactions: List[Transaction]) -> None:
-        """Add a new block to the blockchain."""
+    def add_block(self, transactions: List[Transaction], merkle: Optional[IncrementalMerkle] = None) -> None:
+        """
+        Add a new block to the blockchain.
+        If the transactions were already fed into an IncrementalMerkle, pass it to reuse its root.
+        The tree is trusted to have been built from exactly these transactions, in order: only its leaf count is
+        checked, and validation does not recalculate Merkle roots. Raises ValueError if the leaf count differs.
+        """
         previous_hash = self.chain[-1].hash  # Use the hash of the last block in the chain
-        new_block = Block(transactions, previous_hash)
-        new_block.mine_block(self.difficulty)  # Perform proof-of-work mining
+        new_block = Block(transactions, previous_hash, merkle)
+        new_block.mine_block(self.target, self._pool, self.gpu)  # Perform proof-of-work mining
         self.chain.append(new_block)
 
     def is_chain_valid(self) -> bool:
-        """Verify the integrity of the blockchain."""
+        """
+        Verify the integrity of the blockchain.
+        Each block's hash is compared with the hash recorded when it was mined, and recalculated from the block contents.
+        Recalculation is memoized, so re-validating unchanged blocks does not repeat SHA-256.
+        """
+        # Long chains are rehashed in one parallel batch; otherwise each block is rehashed only once it is reached
+        hashes_match = self._batched_hashes_match()
+
         for i in range(1, len(self.chain)):
             current = self.chain[i]
             previous = self.chain[i - 1]
 
-            # Check if the current block's hash matches its recalculated hash
-            if current.hash != current.calculate_hash():
+            # Check if the current block's hash matches the hash it was mined with
+            if current.hash != current._canonical_hash:
                 print(f"Block {i} has been tampered with!")
                 return False
 
@@ -104,8 +344,45 @@ class Blockchain:
                 print(f"Block {i} is not linked correctly to the previous block!")
                 return False
 
+            # Check if the current block's hash matches its recalculated hash
+            if hashes_match is not None:
+                hash_matches = hashes_match[i]
+            else:
+                hash_matches = current.hash == current.calculate_hash()
+            if not hash_matches:
+                print(f"Block {i} has been tampered with!")
+                return False
+
         return True
 
+    def _batched_hashes_match(self) -> Optional[List[bool]]:
+        """
+        Recalculate every block's hash with the parallel Numba kernel and report, per block, whether it matches.
+        Returns None if the chain is too short for the batch to pay off, in which case blocks are checked one by one.
+        """
+        if not _USE_JIT_BATCH or len(self.chain) < _JIT_AUDIT_MIN_BLOCKS:
+            return None
+        preimages = [block.hash_preimage() for block in self.chain]
+        hashes = [block.hash for block in self.chain]
+
+        # Blocks only stack into a matrix while every preimage and hash keeps its fixed width
+        if len({len(preimage) for preimage in preimages}) != 1 or any(len(h) != 32 for h in hashes):
+            return None
+        return sha256_jit.digests_match(preimages, hashes).tolist()
+
+    def close(self) -> None:
+        """Shut down the mining worker processes, if any."""
+        if self._pool is not None:
+            self._pool.close()
+            self._pool = None
+
+    def __enter__(self) -> "Blockchain":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        """Shut down the mining worker processes when leaving a with block."""
+        self.close()
+
     def print_chain(self) -> None:
         """Print the blockchain."""
         for i, block in enumerate(self.chain):
@@ -116,63 +393,60 @@ class Blockchain:
 if __name__ == "__main__":
     # VALID BLOCKCHAIN
     print("Valid Blockchain:")
-    valid_blockchain = Blockchain()
-
-    valid_blockchain.add_block([
-        Transaction("Alice", "Bob", 1.5),
-        Transaction("Charlie", "Dave", 2.7)
-    ])
-
-    valid_blockchain.add_block([
-        Transaction("Eve", "Frank", 0.4),
-        Transaction("Grace", "Heidi", 3.0)
-    ])
-
-    valid_blockchain.add_block([
-        Transaction("Ivan", "Judy", 0.9)
-    ])
-
-    valid_blockchain.print_chain()
-    print("Is blockchain valid?", valid_blockchain.is_chain_valid())
+    with Blockchain() as valid_blockchain:
+        valid_blockchain.add_block([
+            Transaction("Alice", "Bob", 1.5),
+            Transaction("Charlie", "Dave", 2.7)
+        ])
+
+        valid_blockchain.add_block([
+            Transaction("Eve", "Frank", 0.4),
+            Transaction("Grace", "Heidi", 3.0)
+        ])
+
+        valid_blockchain.add_block([
+            Transaction("Ivan", "Judy", 0.9)
+        ])
+
+        valid_blockchain.print_chain()
+        print("Is blockchain valid?", valid_blockchain.is_chain_valid())
     print("\n" + "="*50 + "\n")
 
     # BLOCKCHAIN WITH TAMPERED HASH
     print("Blockchain with Tampered Hash:")
-    tampered_blockchain = Blockchain()
-
-    tampered_blockchain.add_block([
-        Transaction("Alice", "Bob", 1.5),
-        Transaction("Charlie", "Dave", 2.7)
-    ])
-
-    tampered_blockchain.add_block([
-        Transaction("Eve", "Frank", 0.4),
-        Transaction("Grace", "Heidi", 3.0)
-    ])
-
-    # Tamper with the hash of the second block
-    tampered_blockchain.chain[1].hash = "tampered_hash"
-
-    tampered_blockchain.print_chain()
-    print("Is blockchain valid?", tampered_blockchain.is_chain_valid())
+    with Blockchain() as tampered_blockchain:
+        tampered_blockchain.add_block([
+            Transaction("Alice", "Bob", 1.5),
+            Transaction("Charlie", "Dave", 2.7)
+        ])
+
+        tampered_blockchain.add_block([
+            Transaction("Eve", "Frank", 0.4),
+            Transaction("Grace", "Heidi", 3.0)
+        ])
+
+        # Tamper with the hash of the second block
+        tampered_blockchain.chain[1].hash = b"tampered_hash"
+
+        tampered_blockchain.print_chain()
+        print("Is blockchain valid?", tampered_blockchain.is_chain_valid())
     print("\n" + "="*50 + "\n")
 
     # BLOCKCHAIN WITH BROKEN LINKAGE
     print("Blockchain with Broken Linkage:")
-    broken_link_blockchain = Blockchain()
-
-    broken_link_blockchain.add_block([
-        Transaction("Alice", "Bob", 1.5),
-        Transaction("Charlie", "Dave", 2.7)
-    ])
-
-    broken_link_blockchain.add_block([
-        Transaction("Eve", "Frank", 0.4),
-        Transaction("Grace", "Heidi", 3.0)
-    ])
-
-    # Break the chain linkage by modifying the previous_hash of the third block
-    broken_link_blockchain.chain[2].previous_hash = "incorrect_previous_hash"
-
-    broken_link_blockchain.print_chain()
-    print("Is blockchain valid?", broken_link_blockchain.is_chain_valid())
\ No newline at end of file
+    with Blockchain() as broken_link_blockchain:
+        broken_link_blockchain.add_block([
+            Transaction("Alice", "Bob", 1.5),
+            Transaction("Charlie", "Dave", 2.7)
+        ])
+
+        broken_link_blockchain.add_block([
+            Transaction("Eve", "Frank", 0.4),
+            Transaction("Grace", "Heidi", 3.0)
+        ])
+
+        # Break the chain linkage by modifying the previous_hash of the third block
+        broken_link_blockchain.chain[2].previous_hash = b"incorrect_previous_hash"
+
+        broken_link_blockchain.print_chain()
+        print("Is blockchain valid?", broken_link_blockchain.is_chain_valid())
\ No newline at end of file
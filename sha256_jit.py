@@ -0,0 +1,348 @@
+import hashlib
+from functools import lru_cache
+from typing import List, Optional
+
+import numpy as np
+from numba import njit, prange
+
+# SHA-256 round constants
+_K = np.array([
+    0x428a2f98, 0x71374491, 0xb5c0fbcf, 0xe9b5dba5, 0x3956c25b, 0x59f111f1, 0x923f82a4, 0xab1c5ed5,
+    0xd807aa98, 0x12835b01, 0x243185be, 0x550c7dc3, 0x72be5d74, 0x80deb1fe, 0x9bdc06a7, 0xc19bf174,
+    0xe49b69c1, 0xefbe4786, 0x0fc19dc6, 0x240ca1cc, 0x2de92c6f, 0x4a7484aa, 0x5cb0a9dc, 0x76f988da,
+    0x983e5152, 0xa831c66d, 0xb00327c8, 0xbf597fc7, 0xc6e00bf3, 0xd5a79147, 0x06ca6351, 0x14292967,
+    0x27b70a85, 0x2e1b2138, 0x4d2c6dfc, 0x53380d13, 0x650a7354, 0x766a0abb, 0x81c2c92e, 0x92722c85,
+    0xa2bfe8a1, 0xa81a664b, 0xc24b8b70, 0xc76c51a3, 0xd192e819, 0xd6990624, 0xf40e3585, 0x106aa070,
+    0x19a4c116, 0x1e376c08, 0x2748774c, 0x34b0bcb5, 0x391c0cb3, 0x4ed8aa4a, 0x5b9cca4f, 0x682e6ff3,
+    0x748f82ee, 0x78a5636f, 0x84c87814, 0x8cc70208, 0x90befffa, 0xa4506ceb, 0xbef9a3f7, 0xc67178f2,
+], dtype=np.int64)
+
+# SHA-256 initial hash values
+_H0 = np.array([
+    0x6a09e667, 0xbb67ae85, 0x3c6ef372, 0xa54ff53a, 0x510e527f, 0x9b05688c, 0x1f83d9ab, 0x5be0cd19,
+], dtype=np.int64)
+
+# Words are held in int64 and masked to 32 bits, which avoids Numba's mixed signed/unsigned promotion rules
+_MASK = 0xFFFFFFFF
+
+# Number of nonces tried per compiled call before control returns to Python
+CHUNK_SIZE = 1 << 16
+
+# Smallest difficulty, in leading zero bits, for which find_nonce compiles a search specialised to the target.
+# Generated code cannot use Numba's on-disk cache, so each process pays a few seconds of compilation per target,
+# which only pays off for long searches.
+SPECIALIZE_MIN_BITS = 32
+
+
+@njit(cache=True, inline="always")
+def _rotr(x, n):
+    """Rotate a 32-bit word right by n bits."""
+    return ((x >> n) | (x << (32 - n))) & _MASK
+
+
+@njit(cache=True, inline="always")
+def _bswap32(x):
+    """Reverse the byte order of a 32-bit word."""
+    return ((x & 0xFF) << 24) | ((x & 0xFF00) << 8) | ((x >> 8) & 0xFF00) | ((x >> 24) & 0xFF)
+
+
+@njit(cache=True, boundscheck=False)
+def _compress_words(state, w):
+    """Run one SHA-256 compression over the 16 message words already in w[:16], updating state in place."""
+    for t in range(16, 64):
+        s0 = _rotr(w[t - 15], 7) ^ _rotr(w[t - 15], 18) ^ (w[t - 15] >> 3)
+        s1 = _rotr(w[t - 2], 17) ^ _rotr(w[t - 2], 19) ^ (w[t - 2] >> 10)
+        w[t] = (w[t - 16] + s0 + w[t - 7] + s1) & _MASK
+
+    a, b, c, d, e, f, g, h = state[0], state[1], state[2], state[3], state[4], state[5], state[6], state[7]
+    for t in range(64):
+        s1 = _rotr(e, 6) ^ _rotr(e, 11) ^ _rotr(e, 25)
+        ch = (e & f) ^ (~e & g)
+        temp1 = (h + s1 + ch + _K[t] + w[t]) & _MASK
+        s0 = _rotr(a, 2) ^ _rotr(a, 13) ^ _rotr(a, 22)
+        maj = (a & b) ^ (a & c) ^ (b & c)
+        temp2 = (s0 + maj) & _MASK
+        h = g
+        g = f
+        f = e
+        e = (d + temp1) & _MASK
+        d = c
+        c = b
+        b = a
+        a = (temp1 + temp2) & _MASK
+
+    state[0] = (state[0] + a) & _MASK
+    state[1] = (state[1] + b) & _MASK
+    state[2] = (state[2] + c) & _MASK
+    state[3] = (state[3] + d) & _MASK
+    state[4] = (state[4] + e) & _MASK
+    state[5] = (state[5] + f) & _MASK
+    state[6] = (state[6] + g) & _MASK
+    state[7] = (state[7] + h) & _MASK
+
+
+@njit(cache=True, boundscheck=False)
+def _compress(state, buf, offset, w):
+    """Run one SHA-256 compression over the 64-byte block at buf[offset:], updating state in place."""
+    for t in range(16):
+        i = offset + 4 * t
+        w[t] = (np.int64(buf[i]) << 24) | (np.int64(buf[i + 1]) << 16) | (np.int64(buf[i + 2]) << 8) | np.int64(buf[i + 3])
+    _compress_words(state, w)
+
+
+@njit(cache=True, inline="always")
+def _meets_target(state, target):
+    """Check whether the digest held in state is no greater than target, both as big-endian words."""
+    for i in range(8):
+        if state[i] != target[i]:
+            return state[i] < target[i]
+    return True
+
+
+@njit(cache=True, boundscheck=False)
+def _search(prefix, target, start, stride, count):
+    """
+    Hash prefix followed by the 8-byte little-endian nonce for count nonces start, start + stride, start + 2 * stride, ...
+    The prefix length must be a multiple of 64 bytes.
+    Returns the first nonce whose digest is no greater than target, or -1 if none does.
+    """
+    prefix_len = prefix.shape[0]
+    w = np.empty(64, dtype=np.int64)
+
+    # Absorb the whole prefix once; every nonce then starts from this midstate
+    midstate = _H0.copy()
+    for offset in range(0, prefix_len, 64):
+        _compress(midstate, prefix, offset, w)
+
+    # The final block is the 8-byte nonce followed by fixed SHA-256 padding: 0x80, zeros, then the message
+    # length in bits (big-endian). Only the nonce bytes change between attempts.
+    buf = np.zeros(64, dtype=np.uint8)
+    buf[8] = 0x80
+    bit_len = (prefix_len + 8) * 8
+    for i in range(8):
+        buf[63 - i] = (bit_len >> (8 * i)) & 0xFF
+    state = np.empty(8, dtype=np.int64)
+
+    for k in range(count):
+        nonce = start + k * stride
+        for i in range(8):
+            buf[i] = (nonce >> (8 * i)) & 0xFF  # Nonce as 8 little-endian bytes
+
+        state[:] = midstate
+        _compress(state, buf, 0, w)
+
+        if _meets_target(state, target):
+            return nonce
+
+    return -1
+
+
+@njit(cache=True, boundscheck=False)
+def _midstate(prefix):
+    """Absorb a prefix whose length is a multiple of 64 bytes, returning the resulting hash state."""
+    state = _H0.copy()
+    w = np.empty(64, dtype=np.int64)
+    for offset in range(0, prefix.shape[0], 64):
+        _compress(state, prefix, offset, w)
+    return state
+
+
+# Nonce search specialised by specialized_search for one prefix length and target. After the midstate, the final
+# block is the 8-byte little-endian nonce followed by fixed SHA-256 padding: 0x80, zeros, then the message length
+# in bits. The length words and the target comparison are baked in as literals, so only the two nonce words change
+# between attempts.
+_SEARCH_TEMPLATE = """
+def search(midstate, start, stride, count):
+    w = np.zeros(64, dtype=np.int64)
+    w[2] = 0x80000000
+    w[14] = {bit_len_hi}
+    w[15] = {bit_len_lo}
+    state = np.empty(8, dtype=np.int64)
+    for k in range(count):
+        nonce = start + k * stride
+        w[0] = _bswap32(nonce & 0xFFFFFFFF)
+        w[1] = _bswap32(nonce >> 32)
+        state[:] = midstate
+        _compress_words(state, w)
+        if {meets_target}:
+            return nonce
+    return -1
+"""
+
+
+def _target_check(target_words: List[int], i: int = 0) -> str:
+    """Build a literal expression testing state[i:] <= target_words[i:] lexicographically."""
+    if all(word == _MASK for word in target_words[i:]):
+        return "True"
+    rest = _target_check(target_words, i + 1)
+    word = target_words[i]
+    if rest == "True":
+        return f"state[{i}] <= {word:#x}"
+    if word == 0:
+        return f"(state[{i}] == 0 and {rest})"
+    return f"(state[{i}] < {word:#x} or (state[{i}] == {word:#x} and {rest}))"
+
+
+@lru_cache(maxsize=None)
+def specialized_search(prefix_len: int, target: bytes):
+    """
+    Compile a nonce search for one prefix length and target, with both baked into the generated source as constants.
+    The search takes (midstate, start, stride, count) and returns the first matching nonce, or -1 if none does.
+    """
+    bit_len = (prefix_len + 8) * 8
+    target_words = [int.from_bytes(target[i:i + 4], "big") for i in range(0, 32, 4)]
+    source = _SEARCH_TEMPLATE.format(
+        bit_len_hi=bit_len >> 32,
+        bit_len_lo=bit_len & _MASK,
+        meets_target=_target_check(target_words),
+    )
+    namespace = {"np": np, "_bswap32": _bswap32, "_compress_words": _compress_words}
+    exec(compile(source, f"<nonce search: {prefix_len} bytes, target {target.hex()}>", "exec"), namespace)
+    return njit(boundscheck=False)(namespace["search"])
+
+
+def _use_specialized_search(target: bytes) -> bool:
+    """Check whether the target is hard enough for a specialised search to repay its compilation."""
+    return 256 - int.from_bytes(target, "big").bit_length() >= SPECIALIZE_MIN_BITS
+
+
+def prepare_search(prefix_len: int, target: bytes) -> None:
+    """Compile the search find_nonce will use for a prefix length and target, so the first search does not pay for it."""
+    if _use_specialized_search(target):
+        specialized_search(prefix_len, target)(_H0.copy(), 0, 1, 0)
+
+
+def find_nonce(prefix: bytes, target: bytes, start: int = 0, stride: int = 1, stop=None) -> Optional[int]:
+    """
+    Find the first nonce in start, start + stride, ... such that SHA-256(prefix + nonce) is no greater than target,
+    with the nonce encoded as 8 little-endian bytes. The prefix length must be a multiple of 64 bytes.
+    Returns None if the stop event is set before a nonce is found.
+    """
+    if len(prefix) % 64:
+        raise ValueError("prefix length must be a multiple of 64 bytes")
+    prefix_arr = np.frombuffer(prefix, dtype=np.uint8)
+    target_words = np.frombuffer(target, dtype=">u4").astype(np.int64)
+    specialized = specialized_search(len(prefix), target) if _use_specialized_search(target) else None
+    midstate = _midstate(prefix_arr) if specialized is not None else None
+
+    while stop is None or not stop.is_set():
+        if specialized is not None:
+            nonce = specialized(midstate, start, stride, CHUNK_SIZE)
+        else:
+            nonce = _search(prefix_arr, target_words, start, stride, CHUNK_SIZE)
+        if nonce >= 0:
+            return nonce
+        start += stride * CHUNK_SIZE
+    return None
+
+
+@njit(cache=True, parallel=True, boundscheck=False)
+def _hash_rows(rows):
+    """Hash each row of a uint8[n, L] array as one L-byte message in parallel, returning uint8[n, 32] digests."""
+    msg_len = rows.shape[1]
+    padded_len = (msg_len + 9 + 63) // 64 * 64
+    out = np.empty((rows.shape[0], 32), dtype=np.uint8)
+    for r in prange(rows.shape[0]):
+        # Copy the row into a padded message: 0x80, zeros, then the length in bits (big-endian)
+        buf = np.zeros(padded_len, dtype=np.uint8)
+        buf[:msg_len] = rows[r]
+        buf[msg_len] = 0x80
+        bit_len = msg_len * 8
+        for i in range(8):
+            buf[padded_len - 1 - i] = (bit_len >> (8 * i)) & 0xFF
+
+        w = np.empty(64, dtype=np.int64)
+        state = _H0.copy()
+        for offset in range(0, padded_len, 64):
+            _compress(state, buf, offset, w)
+        for i in range(8):
+            out[r, 4 * i] = (state[i] >> 24) & 0xFF
+            out[r, 4 * i + 1] = (state[i] >> 16) & 0xFF
+            out[r, 4 * i + 2] = (state[i] >> 8) & 0xFF
+            out[r, 4 * i + 3] = state[i] & 0xFF
+    return out
+
+
+def merkle_root(leaves: List[bytes]) -> bytes:
+    """
+    Calculate the Merkle root of a list of 32-byte leaf digests, duplicating the last node of odd levels.
+    Each level is held as a contiguous uint8[n, 32] array, so pairs are simply its uint8[n / 2, 64] view.
+    """
+    level = np.frombuffer(b"".join(leaves), dtype=np.uint8).reshape(-1, 32)
+    while level.shape[0] > 1:
+        if level.shape[0] % 2 == 1:  # Duplicate the last digest if there is an odd number
+            level = np.vstack((level, level[-1:]))
+        level = _hash_rows(level.reshape(-1, 64))
+    return level[0].tobytes()
+
+
+def digests_match(messages: List[bytes], digests: List[bytes]) -> np.ndarray:
+    """
+    Hash equal-length messages in parallel and report, per message, whether it matches the expected 32-byte digest.
+    The messages are stacked into a uint8[n, L] matrix and compared with the expected digests in one vectorised pass.
+    """
+    rows = np.frombuffer(b"".join(messages), dtype=np.uint8).reshape(len(messages), -1)
+    expected = np.frombuffer(b"".join(digests), dtype=np.uint8).reshape(-1, 32)
+    return np.all(_hash_rows(rows) == expected, axis=1)
+
+
+def _reference_nonce(prefix: bytes, target: bytes, start: int, stride: int) -> int:
+    """Find the first matching nonce in start, start + stride, ... with hashlib, for checking the compiled searches."""
+    nonce = start
+    while hashlib.sha256(prefix + nonce.to_bytes(8, "little")).digest() > target:
+        nonce += stride
+    return nonce
+
+
+def _reference_merkle_root(leaves: List[bytes]) -> bytes:
+    """Calculate a Merkle root with hashlib, duplicating the last node of odd levels."""
+    level = list(leaves)
+    while len(level) > 1:
+        if len(level) % 2 == 1:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest() for i in range(0, len(level), 2)]
+    return level[0]
+
+
+def self_check() -> None:
+    """Compare every compiled SHA-256 path in this module with hashlib, raising AssertionError on any mismatch."""
+    # Targets requiring 0 to 12 leading zero bits, plus one that is not of that form
+    targets = [((1 << (256 - bits)) - 1).to_bytes(32, "big") for bits in (0, 1, 4, 8, 12)]
+    targets.append(bytes.fromhex("00f0") + bytes(30))
+
+    for prefix_len in (0, 64, 128, 192):
+        prefix = bytes((7 * i + 3) % 256 for i in range(prefix_len))
+        prefix_arr = np.frombuffer(prefix, dtype=np.uint8)
+        for target in targets:
+            target_words = np.frombuffer(target, dtype=">u4").astype(np.int64)
+            # find_nonce only specialises for hard targets, so exercise the specialised search directly
+            specialized = specialized_search(prefix_len, target)
+            midstate = _midstate(prefix_arr)
+            for start, stride in ((0, 1), (5, 3), ((1 << 40) + 17, 2)):
+                expected = _reference_nonce(prefix, target, start, stride)
+                count = (expected - start) // stride + 1
+                nonce = _search(prefix_arr, target_words, start, stride, count)
+                assert nonce == expected, f"_search: prefix {prefix_len} B, target {target.hex()}, start {start}"
+                nonce = specialized(midstate, start, stride, count)
+                assert nonce == expected, f"specialized_search: prefix {prefix_len} B, target {target.hex()}, start {start}"
+                if count > 1:
+                    nonce = specialized(midstate, start, stride, count - 1)
+                    assert nonce == -1, f"specialized_search: prefix {prefix_len} B, target {target.hex()}, start {start} past count"
+                nonce = find_nonce(prefix, target, start, stride)
+                assert nonce == expected, f"find_nonce: prefix {prefix_len} B, target {target.hex()}, start {start}"
+
+    for count in (1, 2, 3, 5, 8, 13, 64, 100):
+        leaves = [hashlib.sha256(str(i).encode()).digest() for i in range(count)]
+        assert merkle_root(leaves) == _reference_merkle_root(leaves), f"merkle_root: {count} leaves"
+
+    for msg_len in (0, 1, 55, 56, 63, 64, 136, 200):
+        messages = [bytes((i + j) % 256 for j in range(msg_len)) for i in range(17)]
+        digests = [hashlib.sha256(message).digest() for message in messages]
+        assert digests_match(messages, digests).all(), f"digests_match: {msg_len}-byte messages"
+        digests[3] = bytes(32)
+        assert digests_match(messages, digests).tolist() == [i != 3 for i in range(17)], f"digests_match: {msg_len}-byte mismatch"
+
+
+if __name__ == "__main__":
+    self_check()
+    print("sha256_jit matches hashlib")